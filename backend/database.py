@@ -1,16 +1,73 @@
 import sqlite3
 from typing import List, Dict, Optional
+from db_pool import SQLiteConnectionPool
 
 DATABASE_PATH = "news_curator.db"
 
+# SQL statements are kept as module-level constants so the same string object
+# is reused on every call, letting sqlite3's statement cache skip recompiling.
+SQL_INSERT_ARTICLE = """
+    INSERT OR REPLACE INTO articles (id, title, content, url, source, published_at, keywords)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+ARTICLE_COLUMNS = (
+    "id",
+    "title",
+    "content",
+    "url",
+    "source",
+    "fetch_date",
+    "keywords",
+    "published_at",
+)
+SQL_GET_ARTICLE = f"SELECT {', '.join(ARTICLE_COLUMNS)} FROM articles WHERE id = ?"
+SQL_GET_ARTICLE_KEYWORDS = "SELECT keywords FROM articles WHERE id = ?"
+SQL_INSERT_REACTION = """
+    INSERT INTO user_reactions (article_id, reaction)
+    VALUES (?, ?)
+"""
+SQL_GET_PREFERENCE_WEIGHT = "SELECT weight FROM preferences WHERE keyword = ?"
+SQL_UPDATE_PREFERENCE_WEIGHT = """
+    INSERT OR REPLACE INTO preferences (keyword, weight, last_updated)
+    VALUES (?, ?, CURRENT_TIMESTAMP)
+"""
+# Adds an adjustment to a keyword's weight, clamped to [min, max], in one step
+SQL_ADJUST_PREFERENCE_WEIGHT = """
+    INSERT INTO preferences (keyword, weight)
+    VALUES (?, ?)
+    ON CONFLICT(keyword) DO UPDATE SET
+        weight = MAX(?, MIN(?, preferences.weight + ?)),
+        last_updated = CURRENT_TIMESTAMP
+"""
+SQL_GET_ALL_PREFERENCES = """
+    SELECT keyword, weight, last_updated FROM preferences
+    ORDER BY weight DESC
+"""
+SQL_ANY_PREFERENCES = "SELECT 1 FROM preferences LIMIT 1"
+SQL_GET_TOP_KEYWORDS = """
+    SELECT keyword FROM preferences
+    WHERE weight > 0
+    ORDER BY weight DESC
+    LIMIT ?
+"""
+SQL_CLEAR_PREFERENCES = "DELETE FROM preferences"
+SQL_CLEAR_REACTIONS = "DELETE FROM user_reactions"
+
+# Shared connection pool, opened by open_pool() at application startup
+_pool: Optional[SQLiteConnectionPool] = None
+
 
 def init_database():
     """Initialize the SQLite database with required tables."""
     conn = sqlite3.connect(DATABASE_PATH)
-    cursor = conn.cursor()
+    # WAL mode is persistent, so this promotes the database file once
+    conn.execute("PRAGMA journal_mode=WAL")
+
+    # Create all tables and indexes in a single transaction
+    conn.executescript("""
+        BEGIN;
 
-    # Articles table
-    cursor.execute("""
+        -- Articles table
         CREATE TABLE IF NOT EXISTS articles (
             id TEXT PRIMARY KEY,
             title TEXT NOT NULL,
@@ -20,36 +77,57 @@ def init_database():
             fetch_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             keywords TEXT,
             published_at TEXT
-        )
-    """)
+        );
 
-    # Preferences table (keyword weights)
-    cursor.execute("""
+        -- Preferences table (keyword weights)
         CREATE TABLE IF NOT EXISTS preferences (
             keyword TEXT PRIMARY KEY,
             weight REAL NOT NULL DEFAULT 0.0,
             last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
+        );
 
-    # User reactions table
-    cursor.execute("""
+        -- User reactions table
         CREATE TABLE IF NOT EXISTS user_reactions (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             article_id TEXT NOT NULL,
             reaction TEXT NOT NULL CHECK (reaction IN ('like', 'dislike')),
             timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (article_id) REFERENCES articles (id)
-        )
+        );
+
+        -- Index for top-keyword lookups ordered by weight
+        CREATE INDEX IF NOT EXISTS idx_pref_weight ON preferences (weight DESC);
+
+        -- Index for looking up reactions by article
+        CREATE INDEX IF NOT EXISTS idx_reactions_article ON user_reactions (article_id);
+
+        COMMIT;
     """)
 
-    conn.commit()
     conn.close()
 
 
-def get_connection():
-    """Get a database connection."""
-    return sqlite3.connect(DATABASE_PATH)
+def open_pool(min_size: int = 1, max_size: int = 4) -> SQLiteConnectionPool:
+    """Open the shared connection pool."""
+    global _pool
+    if _pool is None:
+        _pool = SQLiteConnectionPool(
+            DATABASE_PATH, min_size=min_size, max_size=max_size
+        )
+    return _pool
+
+
+def close_pool():
+    """Close the shared connection pool."""
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        _pool = None
+
+
+def get_pool() -> SQLiteConnectionPool:
+    """Get the shared connection pool, opening it on first use."""
+    return _pool if _pool is not None else open_pool()
 
 
 class DatabaseManager:
@@ -66,124 +144,112 @@ class DatabaseManager:
         keywords: str = "",
     ):
         """Insert a new article into the database."""
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO articles (id, title, content, url, source, published_at, keywords)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-            (article_id, title, content, url, source, published_at, keywords),
-        )
+        with get_pool().connection() as conn:
+            conn.execute(
+                SQL_INSERT_ARTICLE,
+                (article_id, title, content, url, source, published_at, keywords),
+            )
+
+    @staticmethod
+    def insert_articles(rows: List[tuple]):
+        """Insert a batch of articles in a single transaction.
 
-        conn.commit()
-        conn.close()
+        Each row is (id, title, content, url, source, published_at, keywords).
+        """
+        if not rows:
+            return
+        with get_pool().connection() as conn, conn:
+            conn.execute("BEGIN")
+            conn.executemany(SQL_INSERT_ARTICLE, rows)
 
     @staticmethod
     def get_article(article_id: str) -> Optional[Dict]:
         """Get an article by ID."""
-        conn = get_connection()
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with get_pool().connection() as conn:
+            row = conn.execute(SQL_GET_ARTICLE, (article_id,)).fetchone()
+        return dict(zip(ARTICLE_COLUMNS, row)) if row else None
 
-        cursor.execute("SELECT * FROM articles WHERE id = ?", (article_id,))
-        row = cursor.fetchone()
-        conn.close()
-
-        return dict(row) if row else None
+    @staticmethod
+    def get_article_keywords(article_id: str) -> Optional[str]:
+        """Get the comma-separated keywords of an article by ID."""
+        with get_pool().connection() as conn:
+            row = conn.execute(SQL_GET_ARTICLE_KEYWORDS, (article_id,)).fetchone()
+        return row[0] if row else None
 
     @staticmethod
     def insert_reaction(article_id: str, reaction: str):
         """Insert a user reaction (like/dislike) for an article."""
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            INSERT INTO user_reactions (article_id, reaction)
-            VALUES (?, ?)
-        """,
-            (article_id, reaction),
-        )
-
-        conn.commit()
-        conn.close()
+        with get_pool().connection() as conn:
+            conn.execute(SQL_INSERT_REACTION, (article_id, reaction))
 
     @staticmethod
     def get_preference_weight(keyword: str) -> float:
         """Get the weight for a specific keyword preference."""
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT weight FROM preferences WHERE keyword = ?", (keyword,))
-        row = cursor.fetchone()
-        conn.close()
-
+        with get_pool().connection() as conn:
+            row = conn.execute(SQL_GET_PREFERENCE_WEIGHT, (keyword,)).fetchone()
         return row[0] if row else 0.0
 
     @staticmethod
     def update_preference_weight(keyword: str, weight: float):
         """Update or insert a keyword preference weight."""
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO preferences (keyword, weight, last_updated)
-            VALUES (?, ?, CURRENT_TIMESTAMP)
-        """,
-            (keyword, weight),
-        )
+        with get_pool().connection() as conn:
+            conn.execute(SQL_UPDATE_PREFERENCE_WEIGHT, (keyword, weight))
+
+    @staticmethod
+    def update_preference_weights(rows: List[tuple]):
+        """Update or insert a batch of (keyword, weight) preferences in one transaction."""
+        if not rows:
+            return
+        with get_pool().connection() as conn, conn:
+            conn.execute("BEGIN")
+            conn.executemany(SQL_UPDATE_PREFERENCE_WEIGHT, rows)
 
-        conn.commit()
-        conn.close()
+    @staticmethod
+    def adjust_preference_weights(
+        keywords: List[str], adjustment: float, min_weight: float, max_weight: float
+    ):
+        """Add an adjustment to each keyword's weight, clamped to [min_weight, max_weight]."""
+        if not keywords:
+            return
+        initial_weight = max(min_weight, min(max_weight, adjustment))
+        rows = [
+            (keyword, initial_weight, min_weight, max_weight, adjustment)
+            for keyword in keywords
+        ]
+        with get_pool().connection() as conn, conn:
+            conn.execute("BEGIN")
+            conn.executemany(SQL_ADJUST_PREFERENCE_WEIGHT, rows)
 
     @staticmethod
     def get_all_preferences() -> List[Dict]:
         """Get all user preferences."""
-        conn = get_connection()
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM preferences ORDER BY weight DESC")
-        rows = cursor.fetchall()
-        conn.close()
+        with get_pool().connection() as conn:
+            rows = conn.execute(SQL_GET_ALL_PREFERENCES).fetchall()
+        return [
+            {"keyword": keyword, "weight": weight, "last_updated": last_updated}
+            for keyword, weight, last_updated in rows
+        ]
 
-        return [dict(row) for row in rows]
+    @staticmethod
+    def any_preferences() -> bool:
+        """Check whether any preference has been recorded."""
+        with get_pool().connection() as conn:
+            return conn.execute(SQL_ANY_PREFERENCES).fetchone() is not None
 
     @staticmethod
     def get_top_keywords(limit: int = 5) -> List[str]:
         """Get top positive keywords by weight."""
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT keyword FROM preferences
-            WHERE weight > 0
-            ORDER BY weight DESC
-            LIMIT ?
-        """,
-            (limit,),
-        )
-
-        rows = cursor.fetchall()
-        conn.close()
-
+        with get_pool().connection() as conn:
+            rows = conn.execute(SQL_GET_TOP_KEYWORDS, (limit,)).fetchall()
         return [row[0] for row in rows]
 
     @staticmethod
     def clear_all_preferences():
         """Clear all user preferences (for reset functionality)."""
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("DELETE FROM preferences")
-        cursor.execute("DELETE FROM user_reactions")
-
-        conn.commit()
-        conn.close()
+        with get_pool().connection() as conn, conn:
+            conn.execute("BEGIN")
+            conn.execute(SQL_CLEAR_PREFERENCES)
+            conn.execute(SQL_CLEAR_REACTIONS)
 
 
 # Initialize database when module is imported
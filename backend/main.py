@@ -3,7 +3,7 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from dotenv import load_dotenv
-from database import init_database
+from database import init_database, open_pool, close_pool
 from recommendation_engine import RecommendationEngine
 
 load_dotenv()
@@ -15,9 +15,12 @@ recommendation_engine = RecommendationEngine()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Initialize database on startup
+    # Initialize database and connection pool on startup
     init_database()
+    open_pool()
     yield
+    await recommendation_engine.aclose()
+    close_pool()
 
 
 app = FastAPI(title="News Curator API", version="1.0.0", lifespan=lifespan)
@@ -50,7 +53,7 @@ async def health():
 async def get_recommended_articles(limit: int = 20):
     """Get personalized article recommendations."""
     try:
-        articles = recommendation_engine.get_recommendations(limit=limit)
+        articles = await recommendation_engine.get_recommendations(limit=limit)
         return {"articles": articles, "count": len(articles)}
     except Exception as e:
         raise HTTPException(
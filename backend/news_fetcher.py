@@ -1,36 +1,113 @@
 import datetime
+import functools
 import os
 import json
-import requests
+import httpx
 import hashlib
-from typing import List, Dict, Optional
+import msgspec
+import re
+import threading
+from typing import List, Dict, FrozenSet, Optional, Tuple
+from cachetools import TTLCache
 from database import DatabaseManager
 
 NEWS_KIND = "top"
 EXCLUDED_CATEGORIES = ["entertainment", "travel", "politics", "general", "sports"]
-
-
-def load_trusted_domains():
-    """Load trusted domains from news_sources.json file."""
+RESPONSE_CACHE_SIZE = 512
+RESPONSE_CACHE_TTL_SECONDS = 300
+
+# Simple stopwords to filter out of extracted keywords
+_STOPWORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "could",
+        "should",
+    }
+)
+
+# Runs of 3+ letters or digits; other punctuation splits words. Apostrophes
+# are removed before matching so contractions stay whole ("won't" -> "wont")
+_WORD_RE = re.compile(r"[^\W_]{3,}")
+
+
+@functools.lru_cache(maxsize=1)
+def load_trusted_domains() -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    """Load trusted domains from news_sources.json file.
+
+    Returns the domains both as a sorted tuple (for building query strings)
+    and as a frozenset (for membership checks).
+    """
     try:
         with open("news_sources.json", "r") as f:
             data = json.load(f)
             # Extract unique domains from the sources
-            domains = set()
-            for source in data.get("sources", []):
-                domain = source.get("domain")
-                if domain:
-                    domains.add(domain)
-            return list(domains)
+            domains = frozenset(
+                source["domain"]
+                for source in data.get("sources", [])
+                if source.get("domain")
+            )
+            return tuple(sorted(domains)), domains
     except FileNotFoundError:
         print("Warning: news_sources.json not found, using empty domain list")
-        return []
+        return (), frozenset()
     except Exception as e:
         print(f"Error loading trusted domains: {e}")
-        return []
+        return (), frozenset()
+
+
+TRUSTED_DOMAINS, TRUSTED_DOMAINS_SET = load_trusted_domains()
+
+# Query-string forms of the filters above, built once at import
+_EXCLUDED_CATEGORIES_STR = ",".join(EXCLUDED_CATEGORIES)
+_TRUSTED_DOMAINS_STR = ",".join(TRUSTED_DOMAINS) if TRUSTED_DOMAINS else None
+
+
+class NewsItem(msgspec.Struct):
+    """A single article as returned by TheNewsAPI.com."""
+
+    url: str = ""
+    title: str = ""
+    description: Optional[str] = ""
+    source: Optional[str] = ""
+    categories: List[str] = []
+    relevance_score: Optional[float] = None
+    published_at: Optional[str] = None
+
+
+class NewsResponse(msgspec.Struct):
+    """TheNewsAPI.com response body; only the article list is decoded."""
+
+    data: List[NewsItem] = []
 
 
-TRUSTED_DOMAINS = load_trusted_domains()
+_news_response_decoder = msgspec.json.Decoder(NewsResponse)
 
 
 class NewsAPI:
@@ -43,108 +120,147 @@ class NewsAPI:
         if not self.api_key:
             raise ValueError("THENEWSAPI_KEY environment variable is required")
 
-    def _make_request(self, endpoint: str, params: Dict) -> Optional[Dict]:
-        """Make API request with error handling."""
+        # One long-lived client so connections (and TLS sessions) are kept
+        # alive and reused across requests
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=4),
+        )
+
+        # Upstream results change on a minute scale, so identical queries
+        # are served from memory for a few minutes
+        self._cache = TTLCache(
+            maxsize=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL_SECONDS
+        )
+        self._cache_lock = threading.Lock()
+
+    async def _make_request(
+        self, endpoint: str, params: Dict
+    ) -> Optional[NewsResponse]:
+        """Make API request with error handling, caching successful responses."""
+        cache_key = (endpoint, tuple(sorted(params.items())))
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         params["api_token"] = self.api_key
 
         try:
-            response = requests.get(f"{self.base_url}/{endpoint}", params=params)
+            response = await self.client.get(
+                f"{self.base_url}/{endpoint}", params=params
+            )
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            data = _news_response_decoder.decode(response.content)
+        except httpx.HTTPError as e:
             print(f"API request failed: {e}")
             return None
+        except msgspec.DecodeError as e:
+            print(f"Failed to decode API response: {e}")
+            return None
+
+        with self._cache_lock:
+            self._cache[cache_key] = data
+        return data
+
+    async def aclose(self):
+        """Close the underlying HTTP client."""
+        await self.client.aclose()
 
     def _thirty_days_ago(self) -> datetime.datetime:
         """Get the date 30 days ago in ISO format."""
         return datetime.datetime.now() - datetime.timedelta(days=30)
 
-    def fetch_by_keyword(self, keywords: List[str], limit: int = 10) -> List[Dict]:
+    async def fetch_by_keyword(
+        self, keywords: List[str], limit: int = 10
+    ) -> List[Dict]:
         """Fetch articles by keyword search using OR logic."""
-        search_query = " | ".join(keywords)
+        # All keywords go into one OR query; duplicates are dropped in order
+        search_query = " | ".join(dict.fromkeys(keywords))
         params = {
             "search": search_query,
             "search_fields": "keywords,title,description",
             "limit": limit,
             "language": "en",
-            "exclude_categories": ",".join(EXCLUDED_CATEGORIES),
+            "exclude_categories": _EXCLUDED_CATEGORIES_STR,
             "sort": "relevance_score",
             "published_after": self._thirty_days_ago().strftime("%Y-%m-%d"),
         }
 
         # Add trusted domains filter if available
-        if TRUSTED_DOMAINS:
-            params["domains"] = ",".join(TRUSTED_DOMAINS)
+        if _TRUSTED_DOMAINS_STR:
+            params["domains"] = _TRUSTED_DOMAINS_STR
 
-        data = self._make_request(NEWS_KIND, params)
-        if not data or "data" not in data:
+        data = await self._make_request(NEWS_KIND, params)
+        if data is None:
             return []
 
-        return self._process_articles(data["data"])
+        return self._process_articles(data.data)
 
-    def fetch_by_category(self, category: str, limit: int = 10) -> List[Dict]:
+    async def fetch_by_category(self, category: str, limit: int = 10) -> List[Dict]:
         """Fetch articles by category."""
         params = {
             "categories": category,
             "limit": limit,
             "language": "en",
-            "exclude_categories": ",".join(EXCLUDED_CATEGORIES),
+            "exclude_categories": _EXCLUDED_CATEGORIES_STR,
             "published_after": self._thirty_days_ago().strftime("%Y-%m-%d"),
         }
 
         # Add trusted domains filter if available
-        if TRUSTED_DOMAINS:
-            params["domains"] = ",".join(TRUSTED_DOMAINS)
+        if _TRUSTED_DOMAINS_STR:
+            params["domains"] = _TRUSTED_DOMAINS_STR
 
-        data = self._make_request(NEWS_KIND, params)
-        if not data or "data" not in data:
+        data = await self._make_request(NEWS_KIND, params)
+        if data is None:
             return []
 
-        return self._process_articles(data["data"])
+        return self._process_articles(data.data)
 
-    def fetch_general(self, limit: int = 10) -> List[Dict]:
+    async def fetch_general(self, limit: int = 10) -> List[Dict]:
         """Fetch general trending news."""
         print(f"HMM: {self._thirty_days_ago().isoformat()}")
         params = {
             "limit": limit,
             "language": "en",
-            "exclude_categories": ",".join(EXCLUDED_CATEGORIES),
+            "exclude_categories": _EXCLUDED_CATEGORIES_STR,
             "sort": "published_at",
             "published_after": self._thirty_days_ago().strftime("%Y-%m-%d"),
         }
 
         # Add trusted domains filter if available
-        if TRUSTED_DOMAINS:
-            params["domains"] = ",".join(TRUSTED_DOMAINS)
+        if _TRUSTED_DOMAINS_STR:
+            params["domains"] = _TRUSTED_DOMAINS_STR
 
-        data = self._make_request(NEWS_KIND, params)
-        if not data or "data" not in data:
+        data = await self._make_request(NEWS_KIND, params)
+        if data is None:
             return []
 
-        return self._process_articles(data["data"])
+        return self._process_articles(data.data)
 
-    def _process_articles(self, articles: List[Dict]) -> List[Dict]:
+    def _process_articles(self, articles: List[NewsItem]) -> List[Dict]:
         """Process and normalize article data."""
         processed = []
 
         for article in articles:
             # Generate unique ID from URL
-            article_id = hashlib.md5(article.get("url", "").encode()).hexdigest()
+            article_id = hashlib.blake2b(
+                article.url.encode(), digest_size=16
+            ).hexdigest()
 
             # Extract keywords from title (simple approach)
-            title = article.get("title", "")
-            keywords = self._extract_keywords(title)
+            keywords = self._extract_keywords(article.title)
 
             processed_article = {
                 "id": article_id,
-                "title": title,
-                "content": article.get("description", ""),
-                "url": article.get("url", ""),
-                "source": article.get("source", ""),
-                "categories": article.get("categories", ""),
+                "title": article.title,
+                "content": article.description,
+                "url": article.url,
+                "source": article.source,
+                "categories": article.categories,
                 "keywords": ", ".join(keywords),
-                "relevance_score": article.get("relevance_score"),
-                "published_at": article.get("published_at"),
+                "relevance_score": article.relevance_score,
+                "published_at": article.published_at,
             }
 
             processed.append(processed_article)
@@ -156,46 +272,9 @@ class NewsAPI:
         if not text:
             return []
 
-        # Simple stopwords to filter out
-        stopwords = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "is",
-            "are",
-            "was",
-            "were",
-            "be",
-            "been",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-        }
-
-        # Basic tokenization and filtering
-        words = text.lower().replace(",", "").replace(".", "").replace("'", "").split()
-        keywords = [word for word in words if len(word) > 2 and word not in stopwords]
-
-        # Return first 5 keywords
-        return keywords[:5]
+        # Tokenize and drop short words and stopwords, keeping the first 5
+        words = _WORD_RE.findall(text.lower().replace("'", ""))
+        return [word for word in words if word not in _STOPWORDS][:5]
 
 
 class NewsFetcher:
@@ -207,8 +286,8 @@ class NewsFetcher:
 
     def _save_articles(self, articles: List[Dict]):
         """Helper method to save articles to database."""
-        for article in articles:
-            self.db.insert_article(
+        rows = [
+            (
                 article["id"],
                 article["title"],
                 article["content"],
@@ -217,17 +296,24 @@ class NewsFetcher:
                 article["published_at"],
                 article["keywords"],
             )
+            for article in articles
+        ]
+        self.db.insert_articles(rows)
 
-    def fetch_personalized_articles(
+    async def fetch_personalized_articles(
         self, user_keywords: List[str], limit: int = 10
     ) -> List[Dict]:
         """Fetch articles based on user preferences."""
-        articles = self.api.fetch_by_keyword(user_keywords, limit=limit)
+        articles = await self.api.fetch_by_keyword(user_keywords, limit=limit)
         self._save_articles(articles)
         return articles
 
-    def fetch_general_articles(self, limit: int = 3) -> List[Dict]:
+    async def fetch_general_articles(self, limit: int = 3) -> List[Dict]:
         """Fetch general trending articles."""
-        articles = self.api.fetch_general(limit)
+        articles = await self.api.fetch_general(limit)
         self._save_articles(articles)
         return articles
+
+    async def aclose(self):
+        """Release network resources."""
+        await self.api.aclose()
@@ -10,39 +10,47 @@ class PreferenceEngine:
         self.weight_adjustment = 0.1  # Amount to adjust weights by
         self.max_weight = 1.0
         self.min_weight = -1.0
+        # Top positive keywords by limit; cleared whenever preferences change
+        self._top_keywords_cache: Dict[int, List[str]] = {}
 
     def process_reaction(self, article_id: str, reaction: str):
         """Process user reaction and update preferences."""
         # Record the reaction
         self.db.insert_reaction(article_id, reaction)
 
-        # Get article to extract keywords
-        article = self.db.get_article(article_id)
-        if not article or not article.get("keywords"):
+        # Get article keywords
+        article_keywords = self.db.get_article_keywords(article_id)
+        if not article_keywords:
             return
 
         # Extract keywords from article
-        keywords = [kw.strip() for kw in article["keywords"].split(",") if kw.strip()]
+        keywords = [kw.strip() for kw in article_keywords.split(",") if kw.strip()]
 
         # Update preference weights
         adjustment = (
             self.weight_adjustment if reaction == "like" else -self.weight_adjustment
         )
 
-        for keyword in keywords:
-            current_weight = self.db.get_preference_weight(keyword)
-            new_weight = max(
-                self.min_weight, min(self.max_weight, current_weight + adjustment)
-            )
-            self.db.update_preference_weight(keyword, new_weight)
+        self.db.adjust_preference_weights(
+            keywords, adjustment, self.min_weight, self.max_weight
+        )
+        self._top_keywords_cache = {}
 
     def get_user_preferences(self) -> List[Dict]:
         """Get all user preferences ordered by weight."""
         return self.db.get_all_preferences()
 
+    def has_preferences(self) -> bool:
+        """Check whether any preferences exist."""
+        return self.db.any_preferences()
+
     def get_positive_keywords(self, limit: int = 5) -> List[str]:
         """Get keywords with positive weights."""
-        return self.db.get_top_keywords(limit)
+        keywords = self._top_keywords_cache.get(limit)
+        if keywords is None:
+            keywords = self.db.get_top_keywords(limit)
+            self._top_keywords_cache[limit] = keywords
+        return list(keywords)
 
     def get_preference_summary(self) -> Dict:
         """Get summary of user preferences for debugging."""
@@ -62,6 +70,7 @@ class PreferenceEngine:
     def reset_preferences(self):
         """Clear all user preferences."""
         self.db.clear_all_preferences()
+        self._top_keywords_cache = {}
 
     def get_exploration_categories(self) -> List[str]:
         """Get categories for exploration (simple rotation)."""
@@ -82,9 +91,9 @@ class PreferenceEngine:
         ]
 
         # Only add if no preferences exist
-        if not self.get_user_preferences():
-            for keyword, weight in default_keywords:
-                self.db.update_preference_weight(keyword, weight)
+        if not self.has_preferences():
+            self.db.update_preference_weights(default_keywords)
+            self._top_keywords_cache = {}
 
 
 # For testing
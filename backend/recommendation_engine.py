@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Dict
 from news_fetcher import NewsFetcher
 from preference_engine import PreferenceEngine
@@ -10,42 +11,50 @@ class RecommendationEngine:
         self.news_fetcher = NewsFetcher()
         self.preference_engine = PreferenceEngine()
 
-    def get_recommendations(self, limit: int = 20) -> List[Dict]:
+    async def get_recommendations(self, limit: int = 20) -> List[Dict]:
         """Get personalized article recommendations using 70/20/10 strategy."""
 
-        # Bootstrap preferences if none exist (cold start)
-        if not self.preference_engine.get_user_preferences():
-            self.preference_engine.bootstrap_preferences()
-
         # Get user's top keywords for personalized content
         top_keywords = self.preference_engine.get_positive_keywords(limit=5)
 
-        articles = []
+        # Bootstrap preferences if none exist (cold start)
+        if not top_keywords and not self.preference_engine.has_preferences():
+            self.preference_engine.bootstrap_preferences()
+            top_keywords = self.preference_engine.get_positive_keywords(limit=5)
 
         # 70% personalized content (14 out of 20 articles)
-        personalized_limit = int(limit * 0.7)
+        personalized_limit = int(limit * 0.7) if top_keywords else 0
+
+        # 30% general trending content (6 out of 20 articles)
+        general_limit = limit - personalized_limit
+
+        # Both fetches are independent network calls, so run them concurrently
+        fetches = [self.news_fetcher.fetch_general_articles(limit=general_limit)]
         if top_keywords:
-            personalized_articles = self.news_fetcher.fetch_personalized_articles(
-                top_keywords[:3], limit=personalized_limit
+            fetches.insert(
+                0,
+                self.news_fetcher.fetch_personalized_articles(
+                    top_keywords[:3], limit=personalized_limit
+                ),
             )
-            articles.extend(personalized_articles)
 
-        # 30% general trending content (6 out of 20 articles)
-        general_limit = limit - len(articles)
-        general_articles = self.news_fetcher.fetch_general_articles(limit=general_limit)
-        articles.extend(general_articles)
+        articles = []
+        for batch in await asyncio.gather(*fetches):
+            articles.extend(batch)
 
-        # Remove duplicates while preserving order
-        seen_ids = set()
-        unique_articles = []
+        # Remove duplicates while preserving order (first occurrence wins)
+        unique_articles = {}
         for article in articles:
-            if article["id"] not in seen_ids:
-                seen_ids.add(article["id"])
-                unique_articles.append(article)
-                if len(unique_articles) >= limit:
-                    break
+            unique_articles.setdefault(article["id"], article)
+
+        # If personalized results came up short, fill the rest with general
+        # articles. They are newest-first, so the first page's articles are
+        # deduplicated and the next ones fill the gap.
+        if general_limit < limit and len(unique_articles) < limit:
+            for article in await self.news_fetcher.fetch_general_articles(limit=limit):
+                unique_articles.setdefault(article["id"], article)
 
-        return unique_articles
+        return list(unique_articles.values())[:limit]
 
     def process_user_feedback(self, article_id: str, reaction: str):
         """Process user feedback and update preferences."""
@@ -62,13 +71,17 @@ class RecommendationEngine:
         """Reset all user preferences and reactions."""
         self.preference_engine.reset_preferences()
 
+    async def aclose(self):
+        """Release network resources held by the news fetcher."""
+        await self.news_fetcher.aclose()
+
 
 # For testing
 if __name__ == "__main__":
     engine = RecommendationEngine()
 
     print("Getting recommendations...")
-    recommendations = engine.get_recommendations(limit=10)
+    recommendations = asyncio.run(engine.get_recommendations(limit=10))
 
     print(f"\nFound {len(recommendations)} articles:")
     for i, article in enumerate(recommendations, 1):